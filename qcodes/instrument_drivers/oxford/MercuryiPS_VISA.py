@@ -1,24 +1,40 @@
 import logging
+import re
 import time
+from contextlib import contextmanager
 from distutils.version import LooseVersion
 from functools import partial
-from typing import Any, Callable, Dict, List, Optional, Union, cast
+from typing import (Any, Callable, Dict, Iterator, List, Optional, Sequence,
+                    Tuple, Union, cast)
 
 import numpy as np
+import pyvisa.constants as vi_const
+import pyvisa.errors
 
 from qcodes.instrument.channel import InstrumentChannel
 from qcodes.instrument.visa import VisaInstrument
 from qcodes.math_utils.field_vector import FieldVector
+from qcodes.utils.delaykeyboardinterrupt import DelayedKeyboardInterrupt
+from qcodes.utils.validators import Enum
 
 log = logging.getLogger(__name__)
 visalog = logging.getLogger('qcodes.instrument.visa')
 
+# a response is a number followed by an optional scale and a unit, e.g.
+# '-1.2000mT'
+_SIGNAL_RE = re.compile(r'(-?\d+(?:\.\d*)?)([numkM]?)')
+
+# there might be a scale before the unit. We only want to deal in SI
+# units, so we translate the scale
+_SCALE_TO_FACTOR = {'n': 1e-9, 'u': 1e-6, 'm': 1e-3, 'k': 1e3, 'M': 1e6}
+
 
 def _response_preparser(bare_resp: str) -> str:
     """
-    Pre-parse response from the instrument
+    Pre-parse response from the instrument, i.e. strip the colon separating
+    the value from the echoed command
     """
-    return bare_resp.replace(':', '')
+    return bare_resp[1:] if bare_resp[:1] == ':' else bare_resp
 
 
 def _signal_parser(our_scaling: float, response: str) -> float:
@@ -31,24 +47,35 @@ def _signal_parser(our_scaling: float, response: str) -> float:
         response: What comes back from instrument.ask
     """
 
-    # there might be a scale before the unit. We only want to deal in SI
-    # units, so we translate the scale
-    scale_to_factor = {'n': 1e-9, 'u': 1e-6, 'm': 1e-3,
-                       'k': 1e3, 'M': 1e6}
+    match = _SIGNAL_RE.match(_response_preparser(response))
+    if match is None:
+        raise ValueError(f'Could not parse response: {response}')
+    digits, scale = match.groups()
+    their_scaling = _SCALE_TO_FACTOR.get(scale, 1)
 
-    numchars = ['0', '1', '2', '3', '4', '5', '6', '7', '8', '9', '.', '-']
+    return float(digits)*their_scaling*our_scaling
 
-    response = _response_preparser(response)
-    digits = "".join(d for d in response if d in numchars)
-    scale_and_unit = response[len(digits) :]
-    if scale_and_unit == "":
-        their_scaling: float = 1
-    elif scale_and_unit[0] in scale_to_factor.keys():
-        their_scaling = scale_to_factor[scale_and_unit[0]]
-    else:
-        their_scaling = 1
 
-    return float(digits)*their_scaling*our_scaling
+# parsers for plain SI values and for rates that the instrument reports
+# per minute rather than per second
+_parse_si = partial(_signal_parser, 1)
+_parse_si_per_min = partial(_signal_parser, 1/60)
+
+
+# the ramp statuses and the corresponding instrument commands
+_RAMP_STATUS_TO_CMD = {'HOLD': 'HOLD',
+                       'TO SET': 'RTOS',
+                       'CLAMP': 'CLMP',
+                       'TO ZERO': 'RTOZ'}
+_CMD_TO_RAMP_STATUS = {cmd: status
+                       for status, cmd in _RAMP_STATUS_TO_CMD.items()}
+
+
+def _ramp_status_parser(response: str) -> str:
+    """
+    Parse a ramp status response into the corresponding ramp status
+    """
+    return _CMD_TO_RAMP_STATUS[_response_preparser(response)]
 
 
 class MercuryWorkerPS(InstrumentChannel):
@@ -70,6 +97,8 @@ class MercuryWorkerPS(InstrumentChannel):
 
         super().__init__(parent, name)
         self.uid = UID
+        # the raw get commands of the parameters, keyed by parameter name
+        self._get_cmds: Dict[str, str] = {}
 
         # The firmware update from 2.5 -> 2.6 changed the command
         # syntax slightly
@@ -78,81 +107,122 @@ class MercuryWorkerPS(InstrumentChannel):
         else:
             self.psu_string = "PSU"
 
-        self.add_parameter('voltage',
-                           label='Output voltage',
-                           get_cmd=partial(self._param_getter, 'SIG:VOLT'),
-                           unit='V',
-                           get_parser=partial(_signal_parser, 1))
-
-        self.add_parameter('current',
-                           label='Output current',
-                           get_cmd=partial(self._param_getter, 'SIG:CURR'),
-                           unit='A',
-                           get_parser=partial(_signal_parser, 1))
-
-        self.add_parameter('current_persistent',
-                           label='Output persistent current',
-                           get_cmd=partial(self._param_getter, 'SIG:PCUR'),
-                           unit='A',
-                           get_parser=partial(_signal_parser, 1))
-
-        self.add_parameter('current_target',
-                           label='Target current',
-                           get_cmd=partial(self._param_getter, 'SIG:CSET'),
-                           unit='A',
-                           get_parser=partial(_signal_parser, 1))
-
-        self.add_parameter('field_target',
-                           label='Target field',
-                           get_cmd=partial(self._param_getter, 'SIG:FSET'),
-                           set_cmd=partial(self._param_setter, 'SIG:FSET'),
-                           unit='T',
-                           get_parser=partial(_signal_parser, 1))
+        self._read_prefix = f"READ:DEV:{self.uid}:{self.psu_string}:"
+        self._set_prefix = f"SET:DEV:{self.uid}:{self.psu_string}:"
+
+        self._add_read_parameter('voltage',
+                                 label='Output voltage',
+                                 get_cmd='SIG:VOLT',
+                                 unit='V',
+                                 get_parser=_parse_si)
+
+        self._add_read_parameter('current',
+                                 label='Output current',
+                                 get_cmd='SIG:CURR',
+                                 unit='A',
+                                 get_parser=_parse_si)
+
+        self._add_read_parameter('current_persistent',
+                                 label='Output persistent current',
+                                 get_cmd='SIG:PCUR',
+                                 unit='A',
+                                 get_parser=_parse_si)
+
+        self._add_read_parameter('current_target',
+                                 label='Target current',
+                                 get_cmd='SIG:CSET',
+                                 unit='A',
+                                 get_parser=_parse_si)
+
+        self._add_read_parameter('field_target',
+                                 label='Target field',
+                                 get_cmd='SIG:FSET',
+                                 set_cmd=partial(self._param_setter,
+                                                 'SIG:FSET'),
+                                 unit='T',
+                                 get_parser=_parse_si)
 
         # NB: The current ramp rate follows the field ramp rate
         # (converted via the ATOB param)
-        self.add_parameter('current_ramp_rate',
-                           label='Ramp rate (current)',
-                           unit='A/s',
-                           get_cmd=partial(self._param_getter, 'SIG:RCST'),
-                           get_parser=partial(_signal_parser, 1/60))
-
-        self.add_parameter('field_ramp_rate',
-                           label='Ramp rate (field)',
-                           unit='T/s',
-                           set_cmd=partial(self._param_setter, 'SIG:RFST'),
-                           get_cmd=partial(self._param_getter, 'SIG:RFST'),
-                           get_parser=partial(_signal_parser, 1/60),
-                           set_parser=lambda x: x*60)
-
-        self.add_parameter('field',
-                           label='Field strength',
-                           unit='T',
-                           get_cmd=partial(self._param_getter, 'SIG:FLD'),
-                           get_parser=partial(_signal_parser, 1))
-
-        self.add_parameter('field_persistent',
-                           label='Persistent field strength',
-                           unit='T',
-                           get_cmd=partial(self._param_getter, 'SIG:PFLD'),
-                           get_parser=partial(_signal_parser, 1))
-
-        self.add_parameter('ATOB',
-                           label='Current to field ratio',
-                           unit='A/T',
-                           get_cmd=partial(self._param_getter, 'ATOB'),
-                           get_parser=partial(_signal_parser, 1),
-                           set_cmd=partial(self._param_setter, 'ATOB'))
-
-        self.add_parameter('ramp_status',
-                           label='Ramp status',
-                           get_cmd=partial(self._param_getter, 'ACTN'),
-                           set_cmd=self._ramp_status_setter,
-                           get_parser=_response_preparser,
-                           val_mapping={'HOLD': 'HOLD',
-                                        'TO SET': 'RTOS',
-                                        'CLAMP': 'CLMP',
-                                        'TO ZERO': 'RTOZ'})
+        self._add_read_parameter('current_ramp_rate',
+                                 label='Ramp rate (current)',
+                                 unit='A/s',
+                                 get_cmd='SIG:RCST',
+                                 get_parser=_parse_si_per_min)
+
+        self._add_read_parameter('field_ramp_rate',
+                                 label='Ramp rate (field)',
+                                 unit='T/s',
+                                 set_cmd=partial(self._param_setter,
+                                                 'SIG:RFST'),
+                                 get_cmd='SIG:RFST',
+                                 get_parser=_parse_si_per_min,
+                                 set_parser=lambda x: x*60)
+
+        self._add_read_parameter('field',
+                                 label='Field strength',
+                                 unit='T',
+                                 get_cmd='SIG:FLD',
+                                 get_parser=_parse_si)
+
+        self._add_read_parameter('field_persistent',
+                                 label='Persistent field strength',
+                                 unit='T',
+                                 get_cmd='SIG:PFLD',
+                                 get_parser=_parse_si)
+
+        self._add_read_parameter('ATOB',
+                                 label='Current to field ratio',
+                                 unit='A/T',
+                                 get_cmd='ATOB',
+                                 get_parser=_parse_si,
+                                 set_cmd=partial(self._param_setter, 'ATOB'))
+
+        self._add_read_parameter('ramp_status',
+                                 label='Ramp status',
+                                 get_cmd='ACTN',
+                                 set_cmd=self._ramp_status_setter,
+                                 get_parser=_ramp_status_parser,
+                                 set_parser=_RAMP_STATUS_TO_CMD.__getitem__,
+                                 vals=Enum(*_RAMP_STATUS_TO_CMD))
+
+    def _add_read_parameter(self, name: str, get_cmd: str,
+                            **kwargs: Any) -> None:
+        """
+        Add a parameter that is read out with the raw command get_cmd, e.g.
+        'SIG:VOLT'
+        """
+        self._get_cmds[name] = get_cmd
+        self.add_parameter(name, get_cmd=partial(self._param_getter, get_cmd),
+                           **kwargs)
+
+    def snapshot_base(self, update: Optional[bool] = True,
+                      params_to_skip_update: Optional[Sequence[str]] = None
+                      ) -> Dict[Any, Any]:
+        # the parameters get the responses of the bulk read from the
+        # response cache of the parent
+        with self._parent._reusing_responses():
+            if update:
+                self._prefetch(params_to_skip_update or [])
+            return super().snapshot_base(
+                update=update, params_to_skip_update=params_to_skip_update)
+
+    def _prefetch(self, params_to_skip_update: Sequence[str]) -> None:
+        """
+        Read out all the parameters that a snapshot updates in a single
+        round-trip. Should that fail, the parameters are read out one by one
+        by the snapshot.
+        """
+        get_cmds = [get_cmd for name, get_cmd in self._get_cmds.items()
+                    if name not in params_to_skip_update
+                    and self.parameters[name].snapshot_value
+                    and not self.parameters[name].snapshot_exclude]
+        try:
+            self._bulk_read(get_cmds)
+        except Exception:
+            self.log.warning("Snapshot: Could not read out parameters in "
+                             "bulk, reading them one by one")
+            self.log.info("Details for Snapshot:", exc_info=True)
 
     def ramp_to_target(self) -> None:
         """
@@ -183,12 +253,29 @@ class MercuryWorkerPS(InstrumentChannel):
         Returns:
             The response. Cf. MercuryiPS.ask for how much is returned
         """
-        dressed_cmd = f"READ:DEV:{self.uid}:{self.psu_string}:{get_cmd}"
+        dressed_cmd = self._read_prefix + get_cmd
 
         resp = self._parent.ask(dressed_cmd)
 
         return resp
 
+    def _bulk_read(self, get_cmds: Sequence[str]) -> Dict[str, str]:
+        """
+        Read several parameters using a single round-trip to the instrument
+
+        Args:
+            get_cmds: raw strings for the commands, e.g. ['SIG:VOLT',
+                'SIG:CURR']
+
+        Returns:
+            The responses keyed by the raw command strings
+        """
+        dressed_cmds = [self._read_prefix + get_cmd for get_cmd in get_cmds]
+
+        resps = self._parent.ask_pipelined(dressed_cmds)
+
+        return dict(zip(get_cmds, resps))
+
     def _param_setter(self, set_cmd: str, value: Union[float, str]) -> None:
         """
         General setter function for parameters
@@ -196,7 +283,7 @@ class MercuryWorkerPS(InstrumentChannel):
         Args:
             set_cmd: raw string for the command, e.g. 'SIG:FSET'
         """
-        dressed_cmd = f"SET:DEV:{self.uid}:{self.psu_string}:{set_cmd}:{value}"
+        dressed_cmd = f"{self._set_prefix}{set_cmd}:{value}"
         # the instrument always very verbosely responds
         # the return value of `ask`
         # holds the value reported back by the instrument
@@ -210,12 +297,18 @@ class MercuryiPS(VisaInstrument):
     """
     Driver class for the QCoDeS Oxford Instruments MercuryiPS magnet power
     supply
+
+    Responses to READ commands can be reused for a short while instead of
+    asking the instrument again, see ``ask_ttl``. This is off by default,
+    since e.g. the field and the ramp status change during a ramp without
+    the driver setting anything.
     """
 
     def __init__(self, name: str, address: str, visalib: Optional[str] = None,
                  field_limits: Optional[Callable[[float,
                                                   float,
                                                   float], bool]] = None,
+                 ask_ttl: float = 0,
                  **kwargs: Any) -> None:
         """
         Args:
@@ -228,6 +321,10 @@ class MercuryiPS(VisaInstrument):
                 range (T). The function shall take (x, y, z) as an input and
                 return a boolean describing whether that field value is
                 acceptable.
+            ask_ttl: For how long (s) the response to a READ command is
+                reused for the same command. Any SET command to a device
+                forgets its cached responses. Can later be changed via the
+                ``ask_ttl`` attribute. Defaults to 0, i.e. no reuse.
         """
 
         if field_limits is not None and not(callable(field_limits)):
@@ -248,6 +345,23 @@ class MercuryiPS(VisaInstrument):
         super().__init__(name, address, terminator='\n', visalib=visalib,
                          **kwargs)
 
+        # responses to READ commands, keyed by command and stamped with the
+        # time they were received. Responses younger than ask_ttl seconds
+        # are reused instead of asking the instrument again
+        self._ask_cache: Dict[str, Tuple[float, str]] = {}
+        self.ask_ttl = ask_ttl
+
+        # the IDN can not change while we are connected, so it is only
+        # read out once
+        self._idn_cached: Optional[Dict[str, str]] = None
+
+        # while not None, responses received after this time are reused
+        # regardless of ask_ttl, see _reusing_responses
+        self._reuse_since: Optional[float] = None
+
+        if self.visabackend != 'sim':
+            self._set_tcp_nodelay()
+
         # to ensure a correct snapshot, we must wrap the get function
         self.IDN.get = self.IDN._wrap_get(self._idn_getter)
 
@@ -262,9 +376,8 @@ class MercuryiPS(VisaInstrument):
         self._field_limits = (field_limits if field_limits else
                               lambda x, y, z: True)
 
-        self._target_vector = FieldVector(x=self.GRPX.field(),
-                                          y=self.GRPY.field(),
-                                          z=self.GRPZ.field())
+        x, y, z = self._read_fields()
+        self._target_vector = FieldVector(x=x, y=y, z=z)
 
         for coord, unit in zip(
                 ['x', 'y', 'z', 'r', 'theta',   'phi',     'rho'],
@@ -319,6 +432,19 @@ class MercuryiPS(VisaInstrument):
 
         self.connect_message()
 
+    def _set_tcp_nodelay(self) -> None:
+        """
+        Disable Nagle's algorithm on the socket connection. Every get and set
+        is a short request/response exchange, so we do not want the
+        transmission of a command to be delayed until the previous one has
+        been acknowledged.
+        """
+        try:
+            self.visa_handle.set_visa_attribute(
+                vi_const.ResourceAttribute.tcpip_nodelay, vi_const.VI_TRUE)
+        except (pyvisa.errors.VisaIOError, NotImplementedError) as e:
+            log.warning(f'Could not enable TCP_NODELAY on {self.name}: {e}')
+
     def _get_component(self, coordinate: str) -> float:
         return self._target_vector.get_components(coordinate)[0]
 
@@ -348,9 +474,8 @@ class MercuryiPS(VisaInstrument):
         Get the measured value of a coordinate. Measures all three fields
         and computes whatever coordinate we asked for.
         """
-        meas_field = FieldVector(x=self.GRPX.field(),
-                                 y=self.GRPY.field(),
-                                 z=self.GRPZ.field())
+        x, y, z = self._read_fields()
+        meas_field = FieldVector(x=x, y=y, z=z)
 
         if len(coordinates) == 1:
             return meas_field.get_components(*coordinates)[0]
@@ -369,17 +494,25 @@ class MercuryiPS(VisaInstrument):
         The function to set a target value for a coordinate, i.e. the set_cmd
         for the XXX_target parameters
         """
-        # first validate the new target
-        valid_vec = FieldVector()
-        valid_vec.copy(self._target_vector)
-        valid_vec.set_component(**{coordinate: target})
-        components = valid_vec.get_components('x', 'y', 'z')
-        if not self._field_limits(*components):
-            raise ValueError(f'Cannot set {coordinate} target to {target}, '
-                             'that would violate the field_limits. ')
-
-        # update our internal target cache
-        self._target_vector.set_component(**{coordinate: target})
+        # first validate the new target, then update our internal target
+        # cache. For a cartesian coordinate, the other two components stay
+        # as they are, so there is no need to convert the target via a
+        # scratch FieldVector
+        if coordinate in ('x', 'y', 'z'):
+            components = [
+                target if c == coordinate else v
+                for c, v in zip('xyz', self._target_vector.get_components(
+                    'x', 'y', 'z'))]
+            self._check_field_limits(coordinate, target, components)
+            self._target_vector.set_component(**{coordinate: target})
+        else:
+            valid_vec = FieldVector()
+            valid_vec.copy(self._target_vector)
+            valid_vec.set_component(**{coordinate: target})
+            self._check_field_limits(
+                coordinate, target, valid_vec.get_components('x', 'y', 'z'))
+            # the validated vector already holds the converted target
+            self._target_vector = valid_vec
 
         # actually assign the target on the workers
         cartesian_targ = self._target_vector.get_components('x', 'y', 'z')
@@ -389,6 +522,16 @@ class MercuryiPS(VisaInstrument):
                                    f"{type(worker)}")
             worker.field_target(targ)
 
+    def _check_field_limits(self, coordinate: str, target: float,
+                            components: Sequence[float]) -> None:
+        """
+        Raise if the new (x, y, z) target, given by setting a coordinate to
+        a target value, violates the field limits
+        """
+        if not self._field_limits(*components):
+            raise ValueError(f'Cannot set {coordinate} target to {target}, '
+                             'that would violate the field_limits. ')
+
     def _set_target_field(self, field: FieldVector) -> None:
         for coord in 'xyz':
             self._set_target(coord, field[coord])
@@ -400,13 +543,31 @@ class MercuryiPS(VisaInstrument):
         Returns:
             The normal IDN dict
         """
-        raw_idn_string = self.ask('*IDN?')
-        resps = raw_idn_string.split(':')
+        if self._idn_cached is None:
+            raw_idn_string = self.ask('*IDN?')
+            resps = raw_idn_string.split(':', 4)
+
+            self._idn_cached = {'model': resps[2], 'vendor': resps[1],
+                                'serial': resps[3], 'firmware': resps[4]}
 
-        idn_dict = {'model': resps[2], 'vendor': resps[1],
-                    'serial': resps[3], 'firmware': resps[4]}
+        return dict(self._idn_cached)
 
-        return idn_dict
+    def _read_fields(self) -> List[float]:
+        """
+        Read the measured field of all three workers in a single round-trip
+
+        Returns:
+            The measured (x, y, z) field
+        """
+        workers = [self.GRPX, self.GRPY, self.GRPZ]
+        resps = self.ask_pipelined([worker._read_prefix + 'SIG:FLD'
+                                    for worker in workers])
+        fields = [_parse_si(resp) for resp in resps]
+
+        for worker, field in zip(workers, fields):
+            worker.field.cache.set(field)
+
+        return fields
 
     def _ramp_simultaneously(self) -> None:
         """
@@ -548,23 +709,139 @@ class MercuryiPS(VisaInstrument):
             cmd: the command to send to the instrument
         """
 
+        cached = self._cached_response(cmd)
+        if cached is not None:
+            return cached
+        if cmd.startswith('SET:'):
+            self._invalidate_cache(cmd)
+
         visalog.debug(f"Writing to instrument {self.name}: {cmd}")
         resp = self.visa_handle.query(cmd)
         visalog.debug(f"Got instrument response: {resp}")
 
+        base_resp = self._strip_response(cmd, resp)
+        if cmd.startswith('READ:'):
+            self._ask_cache[cmd] = (time.monotonic(), base_resp)
+
+        return base_resp
+
+    def ask_pipelined(self, cmds: Sequence[str]) -> List[str]:
+        """
+        Like ``ask``, but for several commands at once. All the commands are
+        sent before any response is read back, so that the whole batch
+        costs a single round-trip to the instrument. The instrument handles
+        the commands in order, so the responses come back in that order.
+
+        Args:
+            cmds: the commands to send to the instrument
+
+        Returns:
+            The responses, in the order of the commands
+        """
+        # the cache is consulted and invalidated in command order, so that
+        # a READ after a SET of the same device is not served from the cache
+        base_resps: List[Optional[str]] = []
+        for cmd in cmds:
+            if cmd.startswith('SET:'):
+                self._invalidate_cache(cmd)
+            base_resps.append(self._cached_response(cmd))
+        to_send = [i for i, base_resp in enumerate(base_resps)
+                   if base_resp is None]
+
+        with DelayedKeyboardInterrupt():
+            try:
+                for i in to_send:
+                    visalog.debug(f"Writing to instrument {self.name}: "
+                                  f"{cmds[i]}")
+                    self.visa_handle.write(cmds[i])
+                for i in to_send:
+                    resp = self.visa_handle.read()
+                    visalog.debug(f"Got instrument response: {resp}")
+                    base_resps[i] = self._strip_response(cmds[i], resp)
+            except Exception:
+                # the responses to the remaining commands are still under
+                # way and would be taken as the responses to later commands
+                self.device_clear()
+                raise
+
+        now = time.monotonic()
+        for i in to_send:
+            cmd = cmds[i]
+            if cmd.startswith('READ:'):
+                self._ask_cache[cmd] = (now, cast(str, base_resps[i]))
+            elif cmd.startswith('SET:'):
+                self._invalidate_cache(cmd)
+
+        return cast(List[str], base_resps)
+
+    def _cached_response(self, cmd: str) -> Optional[str]:
+        """
+        Get the cached response to a READ command, unless it is older than
+        the cache lifetime
+        """
+        if not cmd.startswith('READ:'):
+            return None
+        cached = self._ask_cache.get(cmd)
+        if cached is None:
+            return None
+        timestamp, base_resp = cached
+        if self._reuse_since is not None and timestamp >= self._reuse_since:
+            return base_resp
+        if time.monotonic() - timestamp >= self.ask_ttl:
+            return None
+        return base_resp
+
+    @contextmanager
+    def _reusing_responses(self) -> Iterator[None]:
+        """
+        Within this context, the responses to READ commands received since
+        entering it are reused, e.g. those of a bulk read for the parameter
+        getters that follow it
+        """
+        reuse_since = self._reuse_since
+        self._reuse_since = time.monotonic()
+        try:
+            yield
+        finally:
+            self._reuse_since = reuse_since
+
+    def flush_cache(self) -> None:
+        """
+        Forget all cached responses, so that the next read of any parameter
+        is guaranteed to query the instrument
+        """
+        self._ask_cache.clear()
+        self._idn_cached = None
+
+    def _invalidate_cache(self, set_cmd: str) -> None:
+        """
+        Forget the cached responses of the device targeted by a SET command,
+        e.g. everything read from 'DEV:GRPX:PSU' for
+        'SET:DEV:GRPX:PSU:SIG:FSET:0.1'
+        """
+        target = ':'.join(set_cmd.split(':', 4)[1:4])
+        for cmd in [cmd for cmd in self._ask_cache if target in cmd]:
+            del self._ask_cache[cmd]
+
+    @staticmethod
+    def _strip_response(cmd: str, resp: str) -> str:
+        """
+        Strip the response to a command of everything but the value
+        """
         if 'INVALID' in resp:
             log.error(f'Invalid command. Got response: {resp}')
             base_resp = resp
         # if the command was not invalid, it can either be a SET or a READ
         # SET:
         elif resp.endswith('VALID'):
-            base_resp = resp.split(':')[-2]
+            base_resp = resp.rsplit(':', 2)[-2]
         # READ:
         else:
             # For "normal" commands only (e.g. '*IDN?' is excepted):
             # the response of a valid command echoes back said command,
             # thus we remove that part
-            base_cmd = cmd.replace('READ:', '')
-            base_resp = resp.replace(f'STAT:{base_cmd}', '')
+            base_cmd = cmd[5:] if cmd.startswith('READ:') else cmd
+            echo = f'STAT:{base_cmd}'
+            base_resp = resp[len(echo):] if resp.startswith(echo) else resp
 
         return base_resp
@@ -2,10 +2,13 @@ import logging
 
 import pytest
 import numpy as np
+import pyvisa.constants as vi_const
+import pyvisa.errors
 import hypothesis as hst
 from hypothesis import HealthCheck, settings
 
-from qcodes.instrument_drivers.oxford.MercuryiPS_VISA import MercuryiPS
+from qcodes.instrument_drivers.oxford.MercuryiPS_VISA import (
+    MercuryiPS, _response_preparser, _signal_parser)
 import qcodes.instrument.sims as sims
 from qcodes.math_utils.field_vector import FieldVector
 
@@ -58,6 +61,26 @@ def test_idn(driver):
     assert driver.IDN()['model'] == 'SIMULATED MERCURY iPS'
 
 
+def test_set_tcp_nodelay(driver, mocker):
+    visa_handle = mocker.patch.object(driver, 'visa_handle')
+
+    driver._set_tcp_nodelay()
+
+    visa_handle.set_visa_attribute.assert_called_once_with(
+        vi_const.VI_ATTR_TCPIP_NODELAY, vi_const.VI_TRUE)
+
+
+def test_set_tcp_nodelay_failure_is_logged(driver, mocker, caplog):
+    visa_handle = mocker.patch.object(driver, 'visa_handle')
+    visa_handle.set_visa_attribute.side_effect = pyvisa.errors.VisaIOError(
+        vi_const.VI_ERROR_NSUP_ATTR)
+
+    with caplog.at_level(logging.WARNING):
+        driver._set_tcp_nodelay()
+
+    assert 'Could not enable TCP_NODELAY' in caplog.text
+
+
 def test_simple_setting(driver):
     """
     Some very simple setting of parameters. Mainly just to
@@ -160,3 +183,198 @@ def test_ramp_safely(driver, x, y, z, caplog):
         ramp_order = get_ramp_order(caplog.records)
 
     assert ramp_order == list(exp_order)
+
+
+def test_bulk_read(driver):
+    driver.GRPX.field_target(0.2)
+    driver.GRPX.ramp_status('HOLD')
+
+    resps = driver.GRPX._bulk_read(['SIG:FSET', 'ACTN', 'SIG:FLD'])
+
+    assert resps == {'SIG:FSET': '0.2', 'ACTN': 'HOLD', 'SIG:FLD': '0'}
+
+
+def test_snapshot_reads_in_bulk(driver, mocker):
+    driver.GRPY.field_target(0.3)
+    query = mocker.spy(driver.visa_handle, 'query')
+    bulk_read = mocker.spy(driver.GRPY, '_bulk_read')
+
+    snap = driver.GRPY.snapshot_base(update=True,
+                                     params_to_skip_update=['voltage'])
+
+    query.assert_not_called()
+    get_cmds = bulk_read.call_args[0][0]
+    assert 'SIG:FSET' in get_cmds
+    assert 'SIG:VOLT' not in get_cmds
+    assert snap['parameters']['field_target']['value'] == 0.3
+
+    # outside of the snapshot, the responses are not reused
+    driver.GRPY.field_target()
+    query.assert_called_once_with('READ:DEV:GRPY:PSU:SIG:FSET')
+
+
+def test_snapshot_survives_failing_bulk_read(driver, mocker, caplog):
+    driver.GRPX.field_target(0.4)
+    mocker.patch.object(driver, 'ask_pipelined',
+                        side_effect=pyvisa.errors.VisaIOError(
+                            vi_const.VI_ERROR_TMO))
+    ask = mocker.spy(driver, 'ask')
+
+    with caplog.at_level(logging.WARNING):
+        snap = driver.GRPX.snapshot(update=True)
+
+    assert 'Could not read out parameters in bulk' in caplog.text
+    ask.assert_any_call('READ:DEV:GRPX:PSU:SIG:FSET')
+    assert snap['parameters']['field_target']['value'] == 0.4
+
+
+def test_ask_pipelined_clears_session_on_failure(driver, mocker):
+    write = mocker.spy(driver.visa_handle, 'write')
+    read = mocker.patch.object(driver.visa_handle, 'read',
+                               side_effect=pyvisa.errors.VisaIOError(
+                                   vi_const.VI_ERROR_TMO))
+    device_clear = mocker.spy(driver, 'device_clear')
+
+    with pytest.raises(pyvisa.errors.VisaIOError):
+        driver.ask_pipelined(['READ:DEV:GRPX:PSU:SIG:FSET',
+                              'READ:DEV:GRPX:PSU:ACTN'])
+
+    device_clear.assert_called_once()
+
+    # the simulated instrument does not support a device clear, so we
+    # drain the unread responses ourselves
+    mocker.stop(read)
+    for _ in range(write.call_count):
+        driver.visa_handle.read()
+
+
+def test_ask_cache(driver, mocker):
+    driver.ask_ttl = 10
+    driver.GRPZ.field_target(0.1)
+    assert driver.GRPZ.field_target() == 0.1
+
+    query = mocker.spy(driver.visa_handle, 'query')
+    assert driver.GRPZ.field_target() == 0.1
+    query.assert_not_called()
+
+    # a set of any parameter of the PSU invalidates its cached values
+    driver.GRPZ.field_target(0.2)
+    assert driver.GRPZ.field_target() == 0.2
+
+    driver.flush_cache()
+    assert driver._ask_cache == {}
+
+
+def test_ask_cache_is_off_by_default(driver, mocker):
+    assert driver.ask_ttl == 0
+    driver.GRPZ.field()
+
+    query = mocker.spy(driver.visa_handle, 'query')
+    driver.GRPZ.field()
+    query.assert_called_once_with('READ:DEV:GRPZ:PSU:SIG:FLD')
+
+
+def test_ask_ttl_argument():
+    mips = MercuryiPS('mips_ttl', address='GPIB::1::INSTR',
+                      visalib=visalib, ask_ttl=0.5)
+    try:
+        assert mips.ask_ttl == 0.5
+    finally:
+        mips.close()
+
+
+@pytest.mark.parametrize('response, scaling, expected',
+                         [('0', 1, 0),
+                          (':0.1000T', 1, 0.1),
+                          (':-1.5000mT', 1, -1.5e-3),
+                          (':12.0000T/m', 1/60, 0.2),
+                          (':2.0000kA/T', 1, 2e3),
+                          (':4.0000uV', 1, 4e-6)])
+def test_signal_parser(response, scaling, expected):
+    assert _signal_parser(scaling, response) == pytest.approx(expected)
+
+
+def test_signal_parser_raises_on_garbage():
+    with pytest.raises(ValueError):
+        _signal_parser(1, 'ERROR')
+
+
+@pytest.mark.parametrize('cmd, resp, expected',
+                         [('READ:DEV:GRPX:PSU:SIG:FLD',
+                           'STAT:DEV:GRPX:PSU:SIG:FLD:0.1000T', ':0.1000T'),
+                          ('READ:DEV:GRPX:PSU:SIG:FLD', '0', '0'),
+                          ('*IDN?', 'IDN:OXFORD INSTRUMENTS:MERCURY iPS',
+                           'IDN:OXFORD INSTRUMENTS:MERCURY iPS'),
+                          ('SET:DEV:GRPX:PSU:SIG:FSET:0.1',
+                           'STAT:SET:DEV:GRPX:PSU:SIG:FSET:0.1:VALID', '0.1')])
+def test_strip_response(cmd, resp, expected):
+    assert MercuryiPS._strip_response(cmd, resp) == expected
+
+
+def test_idn_is_read_once(driver, mocker):
+    ask = mocker.spy(driver, 'ask')
+
+    assert driver.IDN() == driver.IDN()
+    ask.assert_not_called()
+
+    driver.flush_cache()
+    assert driver.IDN()['model'] == 'SIMULATED MERCURY iPS'
+    ask.assert_called_once_with('*IDN?')
+
+
+@pytest.mark.parametrize('response, expected',
+                         [(':HOLD', 'HOLD'), ('HOLD', 'HOLD'), ('', '')])
+def test_response_preparser(response, expected):
+    assert _response_preparser(response) == expected
+
+
+def test_measured_fields_are_pipelined(driver, mocker):
+    driver.flush_cache()
+    query = mocker.spy(driver.visa_handle, 'query')
+    read = mocker.spy(driver.visa_handle, 'read')
+
+    assert driver.x_measured() == 0
+
+    query.assert_not_called()
+    assert read.call_count == 3
+    assert driver.GRPY.field.cache.get(get_if_invalid=False) == 0
+
+
+def test_ramp_status(driver):
+    driver.GRPX.ramp_status('HOLD')
+    assert driver.GRPX.ramp_status() == 'HOLD'
+    driver.GRPX.ramp_status('TO ZERO')
+    assert driver.GRPX.ramp_status() == 'TO ZERO'
+
+    with pytest.raises(ValueError):
+        driver.GRPX.ramp_status('RTOZ')
+
+    driver.GRPX.ramp_status('HOLD')
+
+
+def test_spherical_target_limits(driver_spher_lim):
+    driver_spher_lim.x_target(1)
+    driver_spher_lim.r_target(1.5)
+    assert driver_spher_lim.x_target() == pytest.approx(1.5)
+
+    with pytest.raises(ValueError):
+        driver_spher_lim.r_target(2.5)
+    assert driver_spher_lim.r_target() == pytest.approx(1.5)
+
+    with pytest.raises(ValueError):
+        driver_spher_lim.y_target(2)
+    assert driver_spher_lim.y_target() == 0
+
+
+def test_ask_pipelined_respects_command_order(driver):
+    driver.ask_ttl = 10
+    read_cmd = 'READ:DEV:GRPX:PSU:SIG:FSET'
+    driver.GRPX.field_target(0)
+    assert driver.ask(read_cmd) == '0'
+
+    resps = driver.ask_pipelined([read_cmd,
+                                  'SET:DEV:GRPX:PSU:SIG:FSET:0.5',
+                                  read_cmd])
+
+    assert resps == ['0', '', '0.5']
+    assert driver.ask(read_cmd) == '0.5'